@@ -20,7 +20,7 @@ from textual.widgets import Static
 from deepagents_cli.clipboard import copy_selection_to_clipboard
 from deepagents_cli.sessions import get_thread_title, save_thread_title
 from deepagents_cli.textual_adapter import TextualUIAdapter, execute_task_textual
-from deepagents_cli.title_generator import TitleGenerator
+from deepagents_cli.title_generator import TitleCache, TitleGenerator
 from deepagents_cli.widgets.approval import ApprovalMenu
 from deepagents_cli.widgets.chat_input import ChatInput
 from deepagents_cli.widgets.loading import LoadingWidget
@@ -31,11 +31,7 @@ from deepagents_cli.widgets.messages import (
     ToolCallMessage,
     UserMessage,
 )
-from deepagents_cli.widgets.skills_messages import (
-    ShowSkillsModal,
-    SkillsCancelled,
-    SkillsSelected,
-)
+from deepagents_cli.widgets.skills_messages import ShowSkillsModal
 from deepagents_cli.widgets.skills_modal import SkillsModal
 from deepagents_cli.widgets.status import StatusBar
 from deepagents_cli.widgets.welcome import WelcomeBanner
@@ -296,6 +292,7 @@ class DeepAgentsApp(App):
         self._agent_running = False
         self._loading_widget: LoadingWidget | None = None
         self._token_tracker: TextualTokenTracker | None = None
+        self._title_generator: TitleGenerator | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the application layout."""
@@ -526,7 +523,11 @@ class DeepAgentsApp(App):
         """Handle request to show skills modal.
 
         Opens the skills modal screen with a callback to handle selection.
+        Repeated requests while the modal is already open are ignored.
         """
+        if isinstance(self.screen, SkillsModal):
+            return
+
         from deepagents_cli.config import Settings
 
         settings = Settings.from_environment()
@@ -854,8 +855,10 @@ class DeepAgentsApp(App):
             return  # Title already generated
 
         # Generate title
-        generator = TitleGenerator()
-        title = await generator.generate_title(first_message)
+        # Reuse one generator so its model and in-memory title cache persist
+        if self._title_generator is None:
+            self._title_generator = TitleGenerator(cache=TitleCache())
+        title = await self._title_generator.generate_title(first_message)
 
         if title:
             await save_thread_title(self._lc_thread_id, title)
@@ -256,6 +256,14 @@ class Settings:
         """
         return Path.home() / ".deepagents"
 
+    def get_title_cache_path(self) -> Path:
+        """Get the on-disk cache used to memoize generated thread titles.
+
+        Returns:
+            Path to ~/.deepagents/title_cache.db
+        """
+        return self.user_deepagents_dir / "title_cache.db"
+
     def get_user_agent_md_path(self, agent_name: str) -> Path:
         """Get user-level AGENTS.md path for a specific agent.
 
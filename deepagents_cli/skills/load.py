@@ -9,6 +9,8 @@ For middleware usage within agents, use deepagents.middleware.skills.SkillsMiddl
 
 from __future__ import annotations
 
+import copy
+import functools
 from pathlib import Path
 
 from deepagents.backends.filesystem import FilesystemBackend
@@ -77,20 +79,75 @@ def list_skills(
 
     # Load user skills first (foundation)
     if user_skills_dir and user_skills_dir.exists():
-        user_backend = FilesystemBackend(root_dir=str(user_skills_dir))
-        user_skills = list_skills_from_backend(backend=user_backend, source_path=".")
-        for skill in user_skills:
-            # Add source field for CLI display
-            extended_skill: ExtendedSkillMetadata = {**skill, "source": "user"}
-            all_skills[skill["name"]] = extended_skill
+        for skill in _list_skills_in_dir(user_skills_dir):
+            all_skills[skill["name"]] = _with_source(skill, "user")
 
     # Load project skills second (override/augment)
     if project_skills_dir and project_skills_dir.exists():
-        project_backend = FilesystemBackend(root_dir=str(project_skills_dir))
-        project_skills = list_skills_from_backend(backend=project_backend, source_path=".")
-        for skill in project_skills:
-            # Add source field for CLI display
-            extended_skill: ExtendedSkillMetadata = {**skill, "source": "project"}
-            all_skills[skill["name"]] = extended_skill
+        for skill in _list_skills_in_dir(project_skills_dir):
+            all_skills[skill["name"]] = _with_source(skill, "project")
 
     return list(all_skills.values())
+
+
+def _with_source(skill: SkillMetadata, source: str) -> ExtendedSkillMetadata:
+    """Copy cached skill metadata for a caller and add the source field for CLI display.
+
+    The copy is deep, so callers cannot mutate the entries held by the parse cache,
+    whatever the frontmatter put in nested fields.
+
+    Args:
+        skill: Skill metadata as returned by the parse cache.
+        source: Where the skill was loaded from ('user' or 'project').
+
+    Returns:
+        Independent copy of the skill metadata with its source.
+    """
+    extended_skill: ExtendedSkillMetadata = {**copy.deepcopy(skill), "source": source}
+    return extended_skill
+
+
+def _skills_dir_signature(skills_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """Fingerprint a skills directory for cache invalidation.
+
+    Covers the directory itself and the SKILL.md of every subdirectory, so adding,
+    removing or editing a skill produces a new signature.
+
+    Args:
+        skills_dir: Skills directory to fingerprint.
+
+    Returns:
+        Sorted (name, mtime_ns, size) entries.
+    """
+    dir_stat = skills_dir.stat()
+    entries = [("", dir_stat.st_mtime_ns, dir_stat.st_size)]
+    for entry in skills_dir.iterdir():
+        if not entry.is_dir():
+            continue
+        try:
+            skill_md_stat = (entry / "SKILL.md").stat()
+        except OSError:
+            continue
+        entries.append((entry.name, skill_md_stat.st_mtime_ns, skill_md_stat.st_size))
+    return tuple(sorted(entries))
+
+
+def _list_skills_in_dir(skills_dir: Path) -> tuple[SkillMetadata, ...]:
+    """List skills in one directory, reusing parsed results while it is unchanged.
+
+    Args:
+        skills_dir: Skills directory to scan.
+
+    Returns:
+        Skill metadata parsed from the directory's SKILL.md files.
+    """
+    return _list_skills_cached(str(skills_dir), _skills_dir_signature(skills_dir))
+
+
+@functools.lru_cache(maxsize=32)
+def _list_skills_cached(
+    skills_dir: str, _signature: tuple[tuple[str, int, int], ...]
+) -> tuple[SkillMetadata, ...]:
+    """Parse skills from a directory; memoized on the directory signature."""
+    backend = FilesystemBackend(root_dir=skills_dir)
+    return tuple(list_skills_from_backend(backend=backend, source_path="."))
@@ -1,29 +1,160 @@
-"""Title generator for conversation threads."""
-
+"""Title generator for conversation threads.
+
+The instruction block is sent as a constant system message ahead of the user
+content, so providers with prompt/prefix caching can reuse it across calls.
+Self-hosted deployments get the same benefit once KV-cache reuse is enabled,
+e.g. ``NIM_ENABLE_KV_CACHE_REUSE=1`` for NIM or
+``KvCacheConfig(enable_block_reuse=True)`` for TensorRT-LLM.
+"""
+
+import asyncio
+import functools
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+
+import aiosqlite
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from deepagents_cli.config import create_model, settings
+
+# Kept free of interpolation so the prompt prefix is byte-identical across calls
+INSTRUCTION_TEMPLATE = (
+    "Generate a concise title (2-4 Chinese words or 3-5 English words) for this conversation.\n"
+    "Return ONLY the title, nothing else."
+)
+_SYSTEM_MESSAGE = SystemMessage(content=INSTRUCTION_TEMPLATE)
+
+# Whitespace, quotes and backticks stripped from both ends of a generated title. Every
+# str.isspace() code point, including NBSP and the ideographic space, lies below U+3001.
+_TITLE_STRIP_CHARS = "".join(c for c in map(chr, range(0x3001)) if c.isspace()) + "\"'`"
+
+# Characters of the first message sent to the model
+_MAX_INPUT = 200
+
+# Upper bound on in-flight title requests issued by generate_titles
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Seconds to wait for the model before giving up on a title
+DEFAULT_TIMEOUT = 5.0
+
+# Number of recent titles each generator keeps in memory
+_MEMO_SIZE = 512
+
+
+@functools.cache
+def _tunables(model_cls: type) -> tuple[bool, bool]:
+    """Report whether a model class exposes `temperature` and `max_tokens`.
+
+    Cached per class so repeated generator construction skips attribute probing.
+    """
+    fields = getattr(model_cls, "model_fields", {})
+    return (
+        "temperature" in fields or hasattr(model_cls, "temperature"),
+        "max_tokens" in fields or hasattr(model_cls, "max_tokens"),
+    )
+
+
+class TitleCache:
+    """SQLite-backed cache of generated titles keyed by a hash of the prompt content."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: Database file to use. If None, uses the path from settings.
+        """
+        self.path = path or settings.get_title_cache_path()
+
+    @staticmethod
+    def key_for(content: str) -> str:
+        """Compute the cache key for prompt content."""
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+    async def get(self, key: str) -> str | None:
+        """Look up a cached title.
+
+        Args:
+            key: Cache key from `key_for`
+
+        Returns:
+            Cached title or None on a miss or database error
+        """
+        if not self.path.exists():
+            return None
+        try:
+            async with (
+                aiosqlite.connect(str(self.path), timeout=30.0) as conn,
+                conn.execute("SELECT title FROM title_cache WHERE key = ?", (key,)) as cursor,
+            ):
+                row = await cursor.fetchone()
+                return row[0] if row else None
+        except aiosqlite.Error:
+            return None
+
+    async def set(self, key: str, title: str) -> None:
+        """Store a title, silently ignoring database errors.
 
-from deepagents_cli.config import create_model
+        Args:
+            key: Cache key from `key_for`
+            title: Cleaned title to store
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            async with aiosqlite.connect(str(self.path), timeout=30.0) as conn:
+                await conn.execute(
+                    """CREATE TABLE IF NOT EXISTS title_cache (
+                           key TEXT PRIMARY KEY,
+                           title TEXT NOT NULL
+                       )"""
+                )
+                await conn.execute(
+                    """INSERT INTO title_cache (key, title)
+                       VALUES (?, ?)
+                       ON CONFLICT(key) DO UPDATE SET title=excluded.title""",
+                    (key, title),
+                )
+                await conn.commit()
+        except (aiosqlite.Error, OSError):
+            return
 
 
 class TitleGenerator:
     """Generate concise titles for conversation threads."""
 
-    def __init__(self, model: BaseChatModel | None = None) -> None:
+    __slots__ = ("_memo", "cache", "max_concurrency", "model", "timeout")
+
+    def __init__(
+        self,
+        model: BaseChatModel | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache: TitleCache | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
         """Initialize with optional model.
 
         Args:
             model: LLM model to use. If None, uses default from config.
+            max_concurrency: Maximum number of concurrent requests in `generate_titles`.
+            cache: Optional title cache consulted before calling the model.
+            timeout: Seconds to wait for the model before returning None.
         """
         self.model = model or self._create_default_model()
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        self.timeout = timeout
+        self._memo: OrderedDict[str, str] = OrderedDict()
 
     def _create_default_model(self) -> BaseChatModel:
         """Create default lightweight model for title generation."""
         # Use the same model creation logic but with low-cost settings
         model = create_model(None)
         # Configure for low-cost generation
-        if hasattr(model, "temperature"):
+        has_temperature, has_max_tokens = _tunables(type(model))
+        if has_temperature:
             model.temperature = 0.3  # type: ignore
-        if hasattr(model, "max_tokens"):
+        if has_max_tokens:
             model.max_tokens = 20  # type: ignore
         return model
 
@@ -38,28 +169,68 @@ class TitleGenerator:
         """
         try:
             # Truncate long messages
-            content = first_message[:200] if len(first_message) > 200 else first_message
-
-            prompt = f"""Generate a concise title (2-4 Chinese words or 3-5 English words) for this conversation.
-Return ONLY the title, nothing else.
-
-User message: {content}
-
-Title:"""
-
-            response = await self.model.ainvoke(prompt)
+            content = first_message[:_MAX_INPUT]
+
+            cache_key = TitleCache.key_for(content)
+            memoized = self._memo.get(cache_key)
+            if memoized:
+                self._memo.move_to_end(cache_key)
+                return memoized
+            if self.cache:
+                cached = await self.cache.get(cache_key)
+                if cached:
+                    self._remember(cache_key, cached)
+                    return cached
+
+            # Bound latency so a slow model cannot hold up the UI
+            response = await asyncio.wait_for(
+                self.model.ainvoke([_SYSTEM_MESSAGE, HumanMessage(content=content)]),
+                timeout=self.timeout,
+            )
             title = self._clean_title(str(response.content))
 
             # Validate length
             if len(title) > 30:
                 title = title[:27] + "..."
 
+            if title:
+                self._remember(cache_key, title)
+                if self.cache:
+                    await self.cache.set(cache_key, title)
+
             return title if title else None
 
         except Exception:
             # Silent failure - don't affect user experience
             return None
 
+    async def generate_titles(self, messages: list[str]) -> list[str | None]:
+        """Generate titles for several conversations concurrently.
+
+        Args:
+            messages: First user message of each conversation
+
+        Returns:
+            Titles in the same order as `messages`, None where generation failed
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def single(message: str) -> str | None:
+            async with semaphore:
+                return await self.generate_title(message)
+
+        results = await asyncio.gather(
+            *(single(message) for message in messages), return_exceptions=True
+        )
+        return [None if isinstance(result, BaseException) else result for result in results]
+
+    def _remember(self, key: str, title: str) -> None:
+        """Add a title to the in-memory LRU, evicting the oldest entry when full."""
+        self._memo[key] = title
+        self._memo.move_to_end(key)
+        if len(self._memo) > _MEMO_SIZE:
+            self._memo.popitem(last=False)
+
     def _clean_title(self, raw: str) -> str:
         """Clean generated title."""
-        return raw.strip().strip("\"'").strip()
+        return raw.strip(_TITLE_STRIP_CHARS)
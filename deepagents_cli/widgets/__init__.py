@@ -1,25 +1,51 @@
-"""Textual widgets for deepagents-cli."""
+"""Textual widgets for deepagents-cli.
+
+Widgets are imported lazily on first attribute access, so importing one widget
+module (or this package) does not pull in every other widget.
+"""
 
 from __future__ import annotations
 
-from deepagents_cli.widgets.chat_input import ChatInput
-from deepagents_cli.widgets.messages import (
-    AssistantMessage,
-    DiffMessage,
-    ErrorMessage,
-    SystemMessage,
-    ToolCallMessage,
-    UserMessage,
-)
-from deepagents_cli.widgets.skill_card import SkillCard
-from deepagents_cli.widgets.skills_messages import (
-    ShowSkillsModal,
-    SkillsCancelled,
-    SkillsSelected,
-)
-from deepagents_cli.widgets.skills_modal import SkillsModal
-from deepagents_cli.widgets.status import StatusBar
-from deepagents_cli.widgets.welcome import WelcomeBanner
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from deepagents_cli.widgets.chat_input import ChatInput
+    from deepagents_cli.widgets.messages import (
+        AssistantMessage,
+        DiffMessage,
+        ErrorMessage,
+        SystemMessage,
+        ToolCallMessage,
+        UserMessage,
+    )
+    from deepagents_cli.widgets.skill_card import SkillCard
+    from deepagents_cli.widgets.skills_messages import (
+        ShowSkillsModal,
+        SkillsCancelled,
+        SkillsSelected,
+    )
+    from deepagents_cli.widgets.skills_modal import SkillsModal
+    from deepagents_cli.widgets.status import StatusBar
+    from deepagents_cli.widgets.welcome import WelcomeBanner
+
+# Maps each exported name to the module that defines it
+_LAZY_IMPORTS = {
+    "AssistantMessage": "deepagents_cli.widgets.messages",
+    "ChatInput": "deepagents_cli.widgets.chat_input",
+    "DiffMessage": "deepagents_cli.widgets.messages",
+    "ErrorMessage": "deepagents_cli.widgets.messages",
+    "ShowSkillsModal": "deepagents_cli.widgets.skills_messages",
+    "SkillCard": "deepagents_cli.widgets.skill_card",
+    "SkillsCancelled": "deepagents_cli.widgets.skills_messages",
+    "SkillsModal": "deepagents_cli.widgets.skills_modal",
+    "SkillsSelected": "deepagents_cli.widgets.skills_messages",
+    "StatusBar": "deepagents_cli.widgets.status",
+    "SystemMessage": "deepagents_cli.widgets.messages",
+    "ToolCallMessage": "deepagents_cli.widgets.messages",
+    "UserMessage": "deepagents_cli.widgets.messages",
+    "WelcomeBanner": "deepagents_cli.widgets.welcome",
+}
 
 __all__ = [
     "AssistantMessage",
@@ -37,3 +63,19 @@ __all__ = [
     "UserMessage",
     "WelcomeBanner",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import exported widgets on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List exported widgets alongside the module's own attributes."""
+    return sorted(set(globals()) | set(__all__))
@@ -2,11 +2,58 @@
 
 from __future__ import annotations
 
+import functools
+import sys
+from typing import Final
+
 from rich.text import Text
 from textual.widgets import Static
 
 from deepagents_cli.config import COLORS
 
+# Styles and labels shared by every card, resolved once at import
+_NAME_STYLE = f"bold {COLORS['primary']}"
+_DIM_STYLE = COLORS["dim"]
+_SOURCE_LABELS: Final[dict[str, Text]] = {
+    "user": Text("[User]", style="cyan"),
+    "project": Text("[Project]", style="green"),
+}
+
+# Number of rendered cards kept across instances, e.g. when the skills modal is reopened
+_RENDER_CACHE_SIZE = 512
+
+
+@functools.lru_cache(maxsize=_RENDER_CACHE_SIZE)
+def _render_card(name: str, description: str, source: str) -> Text:
+    """Build the Rich text shown for a skill, shared by identical cards.
+
+    Args:
+        name: The skill name.
+        description: The description, already truncated for display.
+        source: The normalized source ('user', 'project', or other).
+
+    Returns:
+        Rich Text object with formatted skill info.
+    """
+    card = Text()
+
+    # Skill name (bold, primary color)
+    card.append(name, style=_NAME_STYLE)
+    card.append(" ")
+
+    # Source label
+    label = _SOURCE_LABELS.get(source)
+    if label:
+        card.append_text(label)
+    else:
+        card.append(f"[{source}]", style="dim")
+
+    if description:
+        card.append(" - ")
+        card.append(description, style=_DIM_STYLE)
+
+    return card
+
 
 class SkillCard(Static):
     """Widget displaying a single skill entry with name, description, and source.
@@ -44,7 +91,11 @@ class SkillCard(Static):
         super().__init__(**kwargs)
         self._name = name
         self._description = description
-        self._source = source.lower()
+        # Only a handful of distinct sources exist, so share one string per value
+        self._source = sys.intern(source.lower())
+        self._display_description = self._truncate_description(description)
+        # Content is immutable after construction, so render once up front
+        self._cached_text = _render_card(name, self._display_description, self._source)
 
     def get_skill_name(self) -> str:
         """Return the skill name.
@@ -68,11 +119,8 @@ class SkillCard(Static):
         Returns:
             Formatted source label string.
         """
-        if self._source == "user":
-            return "[User]"
-        elif self._source == "project":
-            return "[Project]"
-        return f"[{self._source}]"
+        label = _SOURCE_LABELS.get(self._source)
+        return label.plain if label else f"[{self._source}]"
 
     def _truncate_description(self, text: str, max_length: int = 80) -> str:
         """Truncate description to max length with ellipsis.
@@ -94,24 +142,4 @@ class SkillCard(Static):
         Returns:
             Rich Text object with formatted skill info.
         """
-        card = Text()
-
-        # Skill name (bold, primary color)
-        card.append(self._name, style=f"bold {COLORS['primary']}")
-        card.append(" ")
-
-        # Source label
-        source_label = self._get_source_label()
-        if self._source == "user":
-            card.append(source_label, style="cyan")
-        elif self._source == "project":
-            card.append(source_label, style="green")
-        else:
-            card.append(source_label, style="dim")
-
-        truncated_desc = self._truncate_description(self._description)
-        if truncated_desc:
-            card.append(" - ")
-            card.append(truncated_desc, style=COLORS["dim"])
-
-        return card
+        return self._cached_text
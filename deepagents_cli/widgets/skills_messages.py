@@ -16,6 +16,8 @@ class ShowSkillsModal(Message):
         agent: The agent identifier to show skills for.
     """
 
+    __slots__ = ("agent",)
+
     def __init__(self, agent: str = "agent") -> None:
         """Initialize the message.
 
@@ -33,6 +35,8 @@ class SkillsSelected(Message):
         skill_name: The name of the selected skill.
     """
 
+    __slots__ = ("skill_name",)
+
     def __init__(self, skill_name: str) -> None:
         """Initialize the message.
 
@@ -46,6 +50,8 @@ class SkillsSelected(Message):
 class SkillsCancelled(Message):
     """Message sent from SkillsModal to App when cancelled."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize the message."""
         super().__init__()
@@ -7,8 +7,9 @@ in a list layout with keyboard and mouse navigation.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
+from textual import work
 from textual.binding import Binding
 from textual.containers import Vertical, VerticalScroll
 from textual.screen import ModalScreen
@@ -17,10 +18,15 @@ from textual.widgets import Label, Static
 from deepagents_cli.config import COLORS, settings
 from deepagents_cli.skills.load import list_skills
 from deepagents_cli.widgets.skill_card import SkillCard
-from deepagents_cli.widgets.skills_messages import SkillsCancelled, SkillsSelected
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
+    from textual.binding import BindingType
+
+    from deepagents_cli.skills.load import ExtendedSkillMetadata
+
+# Cards are mounted in batches of this size as the user scrolls or navigates toward the end
+_MOUNT_BATCH_SIZE = 50
 
 
 class SkillsModal(ModalScreen[dict[str, str] | None]):
@@ -34,7 +40,7 @@ class SkillsModal(ModalScreen[dict[str, str] | None]):
         DEFAULT_CSS: Textual CSS styling for the modal.
     """
 
-    BINDINGS = [
+    BINDINGS: ClassVar[list[BindingType]] = [
         Binding("up", "navigate_up", "Navigate up", show=False),
         Binding("down", "navigate_down", "Navigate down", show=False),
         Binding("left", "navigate_left", "Navigate left", show=False),
@@ -120,7 +126,10 @@ class SkillsModal(ModalScreen[dict[str, str] | None]):
         self._agent = agent
         self._project_skills_dir = project_skills_dir
         self._skill_cards: list[SkillCard] = []
+        self._card_index: dict[int, int] = {}
+        self._mounted_count = 0
         self._selected_index = -1
+        self._prev_selected_index = -1
         self._list: VerticalScroll | None = None
         self._empty_message: Static | None = None
 
@@ -148,26 +157,45 @@ class SkillsModal(ModalScreen[dict[str, str] | None]):
             yield Static("↑↓ Navigate | Enter Select | Esc Cancel | Click to select", classes="footer")
 
     def on_mount(self) -> None:
-        """Load skills when the modal is mounted."""
+        """Start loading skills when the modal is mounted."""
         # Ensure modal has focus to receive keyboard events
         self.focus()
-        self._load_skills()
+        if self._list:
+            self.watch(self._list, "scroll_y", self._on_list_scroll, init=False)
+        if self._empty_message:
+            self._empty_message.update("Loading skills…")
+            self._empty_message.display = True
+        self._load_skills_worker()
+
+    @work(thread=True, exclusive=True)
+    def _load_skills_worker(self) -> None:
+        """Scan skill directories off the event loop and display the results."""
+        skills = self._fetch_skills()
+        self.app.call_from_thread(self._show_skills, skills)
 
-    def _load_skills(self) -> None:
-        """Load skills from user and project directories.
+    def _fetch_skills(self) -> list[ExtendedSkillMetadata]:
+        """Fetch skills from user and project directories.
 
-        Fetches skills using list_skills() and creates SkillCard widgets
-        for each skill. Handles empty state by showing a message.
+        Returns:
+            Skill metadata from list_skills().
         """
         # Get user skills directory
         user_skills_dir = settings.get_user_skills_dir(self._agent)
 
         # Load skills from both sources
-        skills = list_skills(
+        return list_skills(
             user_skills_dir=user_skills_dir,
             project_skills_dir=self._project_skills_dir,
         )
 
+    def _show_skills(self, skills: list[ExtendedSkillMetadata]) -> None:
+        """Create SkillCard widgets for the given skills.
+
+        Handles empty state by showing a message.
+
+        Args:
+            skills: Skill metadata to display.
+        """
         if not skills:
             # Show empty state
             if self._list:
@@ -178,108 +206,126 @@ class SkillsModal(ModalScreen[dict[str, str] | None]):
                 self._empty_message.display = True
             return
 
-        # Create skill cards
+        # Create skill cards; list_skills() always populates every metadata key
+        self._skill_cards = [
+            SkillCard(name=skill["name"], description=skill["description"], source=skill["source"])
+            for skill in skills
+        ]
+        self._mounted_count = 0
         if self._list:
             self._list.remove_children()
-            self._skill_cards = []
             self._list.display = True
+            self._ensure_mounted(0)
         if self._empty_message:
             self._empty_message.display = False
 
-        for skill in skills:
-            card = SkillCard(
-                name=skill["name"],
-                description=skill.get("description", ""),
-                source=skill.get("source", "user"),
-            )
-            self._skill_cards.append(card)
-            if self._list:
-                self._list.mount(card)
+        self._card_index = {id(card): i for i, card in enumerate(self._skill_cards)}
 
         # Select first skill if available
+        self._prev_selected_index = -1
         if self._skill_cards:
             self._selected_index = 0
             self._update_selection()
 
+    def _ensure_mounted(self, index: int) -> None:
+        """Mount skill cards in whole batches until the card at index is mounted.
+
+        Only the cards the user has reached are mounted, so large catalogs do not
+        pay for composing and laying out every card when the modal opens.
+
+        Args:
+            index: Index of the card that must be mounted.
+        """
+        if not self._list or index < self._mounted_count:
+            return
+
+        end = min(len(self._skill_cards), (index // _MOUNT_BATCH_SIZE + 1) * _MOUNT_BATCH_SIZE)
+        # Mount the whole batch at once so Textual performs a single layout pass
+        self._list.mount_all(self._skill_cards[self._mounted_count : end])
+        self._mounted_count = end
+
+    def _on_list_scroll(self, scroll_y: float) -> None:
+        """Mount the next batch of cards when the list is scrolled near its end.
+
+        Args:
+            scroll_y: New vertical scroll offset of the list.
+        """
+        if not self._list or self._mounted_count >= len(self._skill_cards):
+            return
+        if scroll_y >= self._list.max_scroll_y - self._list.size.height:
+            self._ensure_mounted(self._mounted_count)
+
     def _update_selection(self) -> None:
         """Update the visual selection state of skill cards.
 
-        Sets focus on the currently selected card and removes focus from others.
+        Only the previously and newly selected cards are restyled, and focus
+        moves to the new selection.
         """
-        if not self._skill_cards:
+        cards = self._skill_cards
+        if not cards or self._prev_selected_index == self._selected_index:
             return
 
-        for i, card in enumerate(self._skill_cards):
-            if i == self._selected_index:
-                card.add_class("selected")
-            else:
-                card.remove_class("selected")
+        if 0 <= self._prev_selected_index < len(cards):
+            cards[self._prev_selected_index].remove_class("selected")
 
         # Focus the selected card for visual feedback
-        if 0 <= self._selected_index < len(self._skill_cards):
-            self._skill_cards[self._selected_index].focus()
+        if 0 <= self._selected_index < len(cards):
+            self._ensure_mounted(self._selected_index)
+            cards[self._selected_index].add_class("selected")
+            cards[self._selected_index].focus()
 
-    def action_navigate_up(self) -> None:
-        """Navigate up in the skill list."""
-        if not self._skill_cards or self._selected_index < 0:
-            return
+        self._prev_selected_index = self._selected_index
+
+    def _move(self, delta: int) -> None:
+        """Move the selection by delta, wrapping around the list.
 
-        new_index = self._selected_index - 1
-        if new_index < 0:
-            new_index = len(self._skill_cards) - 1
+        Args:
+            delta: Number of positions to move (negative moves up).
+        """
+        count = len(self._skill_cards)
+        if count == 0:
+            return
 
-        self._selected_index = new_index
+        self._selected_index = (self._selected_index + delta) % count
         self._update_selection()
 
+    def action_navigate_up(self) -> None:
+        """Navigate up in the skill list."""
+        self._move(-1)
+
     def action_navigate_down(self) -> None:
         """Navigate down in the skill list."""
-        if not self._skill_cards:
-            return
-
-        new_index = self._selected_index + 1
-        if new_index >= len(self._skill_cards):
-            new_index = 0
-
-        self._selected_index = new_index
-        self._update_selection()
+        self._move(1)
 
     def action_navigate_left(self) -> None:
         """Navigate left in the skill list."""
-        if not self._skill_cards or self._selected_index < 0:
-            return
-
-        self.action_navigate_up()
+        self._move(-1)
 
     def action_navigate_right(self) -> None:
         """Navigate right in the skill list."""
-        if not self._skill_cards:
-            return
-
-        self.action_navigate_down()
+        self._move(1)
 
     def action_select(self) -> None:
         """Select the currently highlighted skill.
 
-        Posts a SkillsSelected message with the skill name and dismisses the modal
-        with both name and description.
+        Dismisses the modal with the skill's name and description, which the
+        caller receives through its push_screen callback.
         """
-        if not self._skill_cards or self._selected_index < 0:
+        if not 0 <= self._selected_index < len(self._skill_cards):
             return
 
         selected_skill = self._skill_cards[self._selected_index]
         skill_name = selected_skill.get_skill_name()
         skill_description = selected_skill.get_skill_description()
 
-        self.post_message(SkillsSelected(skill_name))
         # Return a dict with name and description
         self.dismiss({"name": skill_name, "description": skill_description})
 
     def action_cancel(self) -> None:
         """Cancel the modal and close without selection.
 
-        Posts a SkillsCancelled message and dismisses with None.
+        Dismisses with None.
         """
-        self.post_message(SkillsCancelled())
         self.dismiss(None)
 
     def on_key(self, event) -> None:
@@ -299,10 +345,8 @@ class SkillsModal(ModalScreen[dict[str, str] | None]):
             event: The click event from Textual.
         """
         # Check if a skill card was clicked
-        clicked_widget = event.widget
-        for i, card in enumerate(self._skill_cards):
-            if card == clicked_widget:
-                self._selected_index = i
-                self._update_selection()
-                self.action_select()
-                break
+        index = self._card_index.get(id(event.widget))
+        if index is not None:
+            self._selected_index = index
+            self._update_selection()
+            self.action_select()
@@ -122,7 +122,7 @@ class TestSkillsModalWithMockSkills:
         modal._skill_cards = []
 
         # Load skills
-        modal._load_skills()
+        modal._show_skills(modal._fetch_skills())
 
         # Verify list_skills was called
         mock_list_skills.assert_called_once()
@@ -145,7 +145,7 @@ class TestSkillsModalWithMockSkills:
         modal._empty_message = MagicMock()
         modal._skill_cards = []
 
-        modal._load_skills()
+        modal._show_skills(modal._fetch_skills())
 
         # Verify initial selection
         assert modal._selected_index == 0
@@ -186,7 +186,7 @@ class TestSkillsModalEmptyState:
         modal._empty_message.display = True
 
         # Load skills
-        modal._load_skills()
+        modal._show_skills(modal._fetch_skills())
 
         # Verify list_skills was called
         mock_list_skills.assert_called_once()
@@ -205,7 +205,7 @@ class TestSkillsModalEmptyState:
         modal._skill_cards = []
         modal._selected_index = -1
 
-        modal._load_skills()
+        modal._show_skills(modal._fetch_skills())
 
         # Should not raise an error when selecting with no skills
         modal.action_select()  # Should complete without error
@@ -215,34 +215,24 @@ class TestSkillsModalEmptyState:
 class TestSkillsModalCancellation:
     """Integration tests for SkillsModal cancellation flow."""
 
-    async def test_action_cancel_posts_cancelled_message(self):
-        """Test that action_cancel posts SkillsCancelled message."""
+    async def test_action_cancel_dismisses_with_none(self):
+        """Test that action_cancel dismisses with None without posting messages."""
         modal = SkillsModal(agent="test-agent")
-
-        # Track posted messages
-        posted_messages = []
-
-        def mock_post_message(msg):
-            posted_messages.append(msg)
-
-        modal.post_message = mock_post_message
-
-        # Mock dismiss
+        modal.post_message = MagicMock()
         modal.dismiss = MagicMock()
 
         # Trigger cancel action
         modal.action_cancel()
 
-        # Verify SkillsCancelled was posted
-        assert len(posted_messages) == 1
-        assert isinstance(posted_messages[0], SkillsCancelled)
+        # Cancellation is reported only through dismiss
+        modal.post_message.assert_not_called()
 
         # Verify dismiss was called with None
         modal.dismiss.assert_called_once_with(None)
 
     @patch("deepagents_cli.widgets.skills_modal.list_skills")
-    async def test_action_select_posts_selected_message(self, mock_list_skills):
-        """Test that action_select posts SkillsSelected message."""
+    async def test_action_select_dismisses_with_skill(self, mock_list_skills):
+        """Test that action_select dismisses with the skill without posting messages."""
         mock_list_skills.return_value = [
             {"name": "test-skill", "description": "Test skill", "source": "user"},
         ]
@@ -252,24 +242,16 @@ class TestSkillsModalCancellation:
         modal._empty_message = MagicMock()
         modal._skill_cards = []
 
-        modal._load_skills()
+        modal._show_skills(modal._fetch_skills())
 
-        # Track posted messages
-        posted_messages = []
-
-        def mock_post_message(msg):
-            posted_messages.append(msg)
-
-        modal.post_message = mock_post_message
+        modal.post_message = MagicMock()
         modal.dismiss = MagicMock()
 
         # Select the skill
         modal.action_select()
 
-        # Verify SkillsSelected was posted
-        assert len(posted_messages) == 1
-        assert isinstance(posted_messages[0], SkillsSelected)
-        assert posted_messages[0].skill_name == "test-skill"
+        # Selection is reported only through dismiss
+        modal.post_message.assert_not_called()
 
         # Verify dismiss was called with skill name
         modal.dismiss.assert_called_once_with({"name": "test-skill", "description": "Test skill"})
@@ -313,7 +295,7 @@ the modal can load them.
             mock_settings.skills_dir.return_value = skills_dir
 
             # Load skills
-            modal._load_skills()
+            modal._show_skills(modal._fetch_skills())
 
         # Verify skills were loaded (actual count depends on deepagents backend)
         # We just verify the loading mechanism works
@@ -351,9 +333,7 @@ class TestSkillsModalBindings:
 
     async def test_bindings_include_all_navigation_keys(self):
         """Test that all required navigation keys are bound."""
-        bindings = SkillsModal.BINDINGS
-
-        binding_keys = [binding.key for binding in bindings]
+        binding_keys = frozenset(binding.key for binding in SkillsModal.BINDINGS)
 
         # Navigation keys
         assert "up" in binding_keys
@@ -1,7 +1,9 @@
 """Unit tests for skills loading functionality."""
 
 from pathlib import Path
+from unittest.mock import patch
 
+from deepagents_cli.skills import load
 from deepagents_cli.skills.load import list_skills
 
 
@@ -290,3 +292,82 @@ Content
         skills = list_skills(user_skills_dir=user_dir, project_skills_dir=None)
         assert len(skills) == 1
         assert skills[0]["name"] == "valid-skill"
+
+
+class TestListSkillsCache:
+    """Test that parsed skills are reused until a skills directory changes."""
+
+    @staticmethod
+    def _write_skill(skills_dir: Path, name: str, description: str) -> None:
+        skill_dir = skills_dir / name
+        skill_dir.mkdir(exist_ok=True)
+        (skill_dir / "SKILL.md").write_text(f"""---
+name: {name}
+description: {description}
+---
+
+# {name}
+""")
+
+    def test_unchanged_directory_is_not_rescanned(self, tmp_path: Path) -> None:
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        self._write_skill(skills_dir, "cached-skill", "Cached")
+
+        first = list_skills(user_skills_dir=skills_dir)
+        with patch.object(load, "list_skills_from_backend") as mock_backend:
+            second = list_skills(user_skills_dir=skills_dir)
+
+        mock_backend.assert_not_called()
+        assert second == first
+        assert second[0] is not first[0]
+
+    def test_callers_cannot_mutate_cached_entries(self, tmp_path: Path) -> None:
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        self._write_skill(skills_dir, "cached-skill", "Cached")
+
+        first = list_skills(user_skills_dir=skills_dir)[0]
+        first["metadata"]["owner"] = "someone"
+        first["allowed_tools"].append("shell")
+
+        second = list_skills(user_skills_dir=skills_dir)[0]
+        assert "owner" not in second["metadata"]
+        assert "shell" not in second["allowed_tools"]
+
+    def test_empty_metadata_key_is_listed(self, tmp_path: Path) -> None:
+        skills_dir = tmp_path / "skills"
+        skill_dir = skills_dir / "bare-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("""---
+name: bare-skill
+description: Skill with an empty metadata key
+metadata:
+---
+
+# bare-skill
+""")
+
+        skills = list_skills(user_skills_dir=skills_dir)
+
+        assert [s["name"] for s in skills] == ["bare-skill"]
+        assert skills[0]["metadata"] is None
+
+    def test_changes_invalidate_cache(self, tmp_path: Path) -> None:
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        self._write_skill(skills_dir, "skill-a", "Original description")
+        assert [s["description"] for s in list_skills(user_skills_dir=skills_dir)] == [
+            "Original description"
+        ]
+
+        self._write_skill(skills_dir, "skill-a", "Edited description that is longer")
+        assert [s["description"] for s in list_skills(user_skills_dir=skills_dir)] == [
+            "Edited description that is longer"
+        ]
+
+        self._write_skill(skills_dir, "skill-b", "Added")
+        assert {s["name"] for s in list_skills(user_skills_dir=skills_dir)} == {
+            "skill-a",
+            "skill-b",
+        }
@@ -1,9 +1,11 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
 
 from deepagents_cli.app import DeepAgentsApp
 from deepagents_cli.widgets.messages import SystemMessage
+from deepagents_cli.widgets.skills_messages import ShowSkillsModal
+from deepagents_cli.widgets.skills_modal import SkillsModal
 
 
 @pytest.mark.asyncio
@@ -67,3 +69,32 @@ class TestSkillsCommand:
             assert "**user-skill**: A user skill" in content
             assert "**Project Skills:**" in content
             assert "**project-skill**: A project skill" in content
+
+
+class TestShowSkillsModal:
+    def test_opens_modal(self):
+        """Test that a ShowSkillsModal request pushes the skills modal."""
+        app = DeepAgentsApp()
+
+        with (
+            patch.object(DeepAgentsApp, "screen", new_callable=PropertyMock) as mock_screen,
+            patch.object(app, "push_screen") as mock_push,
+        ):
+            mock_screen.return_value = MagicMock()
+            app.on_show_skills_modal(ShowSkillsModal())
+
+        mock_push.assert_called_once()
+        assert isinstance(mock_push.call_args[0][0], SkillsModal)
+
+    def test_ignores_request_while_modal_open(self):
+        """Test that repeated requests do not stack another skills modal."""
+        app = DeepAgentsApp()
+
+        with (
+            patch.object(DeepAgentsApp, "screen", new_callable=PropertyMock) as mock_screen,
+            patch.object(app, "push_screen") as mock_push,
+        ):
+            mock_screen.return_value = SkillsModal()
+            app.on_show_skills_modal(ShowSkillsModal())
+
+        mock_push.assert_not_called()
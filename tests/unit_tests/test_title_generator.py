@@ -1,112 +1,274 @@
 """Tests for title generator."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
 
-from deepagents_cli.title_generator import TitleGenerator
+from deepagents_cli.title_generator import (
+    INSTRUCTION_TEMPLATE,
+    TitleCache,
+    TitleGenerator,
+    _tunables,
+)
+
+
+@pytest.fixture
+def make_generator():
+    """Return a factory for TitleGenerators backed by a mocked model.
+
+    The model replies with ``content`` unless ``side_effect`` is given, which is
+    installed on ``ainvoke`` as-is. Extra keyword arguments go to TitleGenerator.
+    """
+
+    def _make(content="Title", side_effect=None, **kwargs):
+        mock_model = AsyncMock()
+        mock_response = MagicMock()
+        mock_response.content = content
+        mock_model.ainvoke.return_value = mock_response
+        mock_model.ainvoke.side_effect = side_effect
+        return TitleGenerator(model=mock_model, **kwargs)
+
+    return _make
 
 
 class TestTitleGenerator:
     """Test TitleGenerator functionality."""
 
-    def test_clean_title_removes_quotes(self):
+    def test_clean_title_removes_quotes(self, make_generator):
         """Test that quotes are stripped from titles."""
-        # Mock the model to avoid API calls
-        mock_model = MagicMock()
-        generator = TitleGenerator(model=mock_model)
+        generator = make_generator()
         assert generator._clean_title('"Hello World"') == "Hello World"
         assert generator._clean_title("'Hello World'") == "Hello World"
         assert generator._clean_title("  Hello World  ") == "Hello World"
 
-    def test_clean_title_empty(self):
+    def test_clean_title_mixed_quotes_and_whitespace(self, make_generator):
+        """Test that interleaved quotes, backticks and whitespace are all stripped."""
+        generator = make_generator()
+        assert generator._clean_title(" \" ' Hello World ' \" ") == "Hello World"
+        assert generator._clean_title("`Hello World`\n") == "Hello World"
+        assert generator._clean_title("It's Fine") == "It's Fine"
+        assert generator._clean_title("\u3000数据分析\u3000") == "数据分析"
+        assert generator._clean_title("\xa0'Hello'\xa0") == "Hello"
+
+    def test_clean_title_empty(self, make_generator):
         """Test cleaning empty/whitespace strings."""
-        mock_model = MagicMock()
-        generator = TitleGenerator(model=mock_model)
+        generator = make_generator()
         assert generator._clean_title("  ") == ""
         assert generator._clean_title('"  "') == ""
 
+    def test_tunables_detects_generation_params(self):
+        """Test that capability detection reads class-level attributes and pydantic fields."""
+
+        class PlainModel:
+            temperature = 0.0
+
+        class PydanticLikeModel:
+            model_fields = {"temperature": None, "max_tokens": None}  # noqa: RUF012
+
+        assert _tunables(PlainModel) == (True, False)
+        assert _tunables(PydanticLikeModel) == (True, True)
+
 
 class TestTitleGeneratorAsync:
     """Async tests for title generation."""
 
     @pytest.mark.asyncio
-    async def test_generate_title_with_mock_model(self):
+    async def test_generate_title_with_mock_model(self, make_generator):
         """Test title generation with mocked model."""
-        mock_model = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.content = "Test Title"
-        mock_model.ainvoke.return_value = mock_response
-
-        generator = TitleGenerator(model=mock_model)
+        generator = make_generator("Test Title")
         result = await generator.generate_title("Hello, this is a test message")
 
         assert result == "Test Title"
-        mock_model.ainvoke.assert_called_once()
+        generator.model.ainvoke.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_generate_title_cleans_quotes(self):
-        """Test that generated titles are cleaned of quotes."""
-        mock_model = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.content = '"Quoted Title"'
-        mock_model.ainvoke.return_value = mock_response
+    async def test_generate_title_memoizes_repeated_messages(self, make_generator):
+        """Test that repeated messages are answered from memory without a model call."""
+        generator = make_generator("Test Title")
+        assert await generator.generate_title("Same message") == "Test Title"
+        assert await generator.generate_title("Same message") == "Test Title"
+
+        generator.model.ainvoke.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_generate_title_memo_evicts_oldest(self, make_generator):
+        """Test that the in-memory LRU stays bounded."""
+        generator = make_generator()
+        with patch("deepagents_cli.title_generator._MEMO_SIZE", 2):
+            for message in ("first", "second", "third"):
+                await generator.generate_title(message)
+
+        assert list(generator._memo) == [TitleCache.key_for("second"), TitleCache.key_for("third")]
 
-        generator = TitleGenerator(model=mock_model)
+    @pytest.mark.asyncio
+    async def test_generate_title_cleans_quotes(self, make_generator):
+        """Test that generated titles are cleaned of quotes."""
+        generator = make_generator('"Quoted Title"')
         result = await generator.generate_title("Test message")
 
         assert result == "Quoted Title"
 
     @pytest.mark.asyncio
-    async def test_generate_title_truncates_long_titles(self):
+    async def test_generate_title_truncates_long_titles(self, make_generator):
         """Test that very long titles are truncated."""
-        mock_model = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.content = "A" * 50
-        mock_model.ainvoke.return_value = mock_response
-
-        generator = TitleGenerator(model=mock_model)
+        generator = make_generator("A" * 50)
         result = await generator.generate_title("Test")
 
         assert result == "A" * 27 + "..."
         assert len(result) == 30
 
     @pytest.mark.asyncio
-    async def test_generate_title_handles_empty_response(self):
+    async def test_generate_title_handles_empty_response(self, make_generator):
         """Test that empty response returns None."""
-        mock_model = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.content = "   "
-        mock_model.ainvoke.return_value = mock_response
-
-        generator = TitleGenerator(model=mock_model)
+        generator = make_generator("   ")
         result = await generator.generate_title("Test")
 
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_generate_title_handles_exception(self):
+    async def test_generate_title_handles_exception(self, make_generator):
         """Test that exceptions return None."""
-        mock_model = AsyncMock()
-        mock_model.ainvoke.side_effect = Exception("API Error")
+        generator = make_generator(side_effect=Exception("API Error"))
+        result = await generator.generate_title("Test")
+
+        assert result is None
 
-        generator = TitleGenerator(model=mock_model)
+    @pytest.mark.asyncio
+    async def test_generate_title_times_out(self, make_generator):
+        """Test that a model slower than the timeout yields None."""
+
+        async def slow_ainvoke(_messages):
+            await asyncio.sleep(1)
+
+        generator = make_generator(side_effect=slow_ainvoke, timeout=0.01)
         result = await generator.generate_title("Test")
 
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_generate_title_truncates_long_messages(self):
+    async def test_generate_title_truncates_long_messages(self, make_generator):
         """Test that long messages are truncated before sending to model."""
-        mock_model = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.content = "Short Title"
-        mock_model.ainvoke.return_value = mock_response
-
-        generator = TitleGenerator(model=mock_model)
+        generator = make_generator("Short Title")
         long_message = "A" * 1000
         await generator.generate_title(long_message)
 
         # Check that the invoke was called with truncated content
-        call_args = mock_model.ainvoke.call_args[0][0]
-        assert len(call_args) < 500  # Should be much shorter than 1000 chars
+        messages = generator.model.ainvoke.call_args[0][0]
+        assert len(messages[-1].content) == 200
+
+    @pytest.mark.asyncio
+    async def test_generate_title_uses_constant_system_prefix(self, make_generator):
+        """Test that instructions are sent as an unchanging system message."""
+        generator = make_generator()
+        await generator.generate_title("First message")
+        await generator.generate_title("Second message")
+
+        first, second = (call[0][0] for call in generator.model.ainvoke.call_args_list)
+        assert isinstance(first[0], SystemMessage)
+        assert first[0].content == INSTRUCTION_TEMPLATE
+        assert first[0] == second[0]
+        assert isinstance(first[1], HumanMessage)
+        assert first[1].content == "First message"
+
+    @pytest.mark.asyncio
+    async def test_generate_titles_preserves_order_and_failures(self, make_generator):
+        """Test that batch generation keeps input order and maps failures to None."""
+
+        async def fake_ainvoke(messages):
+            content = messages[-1].content
+            if content == "bad":
+                msg = "API Error"
+                raise RuntimeError(msg)
+            response = MagicMock()
+            response.content = f"Title {content}"
+            return response
+
+        generator = make_generator(side_effect=fake_ainvoke)
+        result = await generator.generate_titles(["a", "bad", "b"])
+
+        assert result == ["Title a", None, "Title b"]
+
+    @pytest.mark.asyncio
+    async def test_generate_titles_batches(self, make_generator):
+        """Test that a batch completes in about one model latency, not the sum."""
+        latency = 0.2
+
+        async def slow_ainvoke(messages):
+            await asyncio.sleep(latency)
+            response = MagicMock()
+            response.content = f"Title {messages[-1].content}"
+            return response
+
+        generator = make_generator(side_effect=slow_ainvoke)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await generator.generate_titles([str(i) for i in range(4)])
+        elapsed = loop.time() - start
+
+        assert result == [f"Title {i}" for i in range(4)]
+        assert generator.model.ainvoke.call_count == 4
+        # Serial calls would take 4x latency; leave headroom for a GC pause
+        assert elapsed < latency * 2.5
+
+    @pytest.mark.asyncio
+    async def test_generate_titles_bounds_concurrency(self, make_generator):
+        """Test that no more than max_concurrency requests run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_ainvoke(_messages):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = MagicMock()
+            response.content = "Title"
+            return response
+
+        generator = make_generator(side_effect=fake_ainvoke, max_concurrency=2)
+        result = await generator.generate_titles([f"message {i}" for i in range(6)])
+
+        assert result == ["Title"] * 6
+        assert peak == 2
+
+
+class TestTitleCache:
+    """Tests for the on-disk title cache."""
+
+    def test_key_is_stable_per_content(self):
+        assert TitleCache.key_for("hello") == TitleCache.key_for("hello")
+        assert TitleCache.key_for("hello") != TitleCache.key_for("world")
+
+    @pytest.mark.asyncio
+    async def test_get_missing_database_returns_none(self, tmp_path):
+        cache = TitleCache(tmp_path / "titles.db")
+        assert await cache.get(TitleCache.key_for("hello")) is None
+
+    @pytest.mark.asyncio
+    async def test_set_then_get(self, tmp_path):
+        cache = TitleCache(tmp_path / "titles.db")
+        key = TitleCache.key_for("hello")
+        await cache.set(key, "Greeting")
+        assert await cache.get(key) == "Greeting"
+
+    @pytest.mark.asyncio
+    async def test_set_recreates_table_after_database_removed(self, tmp_path):
+        cache = TitleCache(tmp_path / "titles.db")
+        await cache.set(TitleCache.key_for("hello"), "Greeting")
+        (tmp_path / "titles.db").unlink()
+
+        key = TitleCache.key_for("world")
+        await cache.set(key, "Planet")
+        assert await cache.get(key) == "Planet"
+
+    @pytest.mark.asyncio
+    async def test_generator_skips_model_on_cache_hit(self, tmp_path, make_generator):
+        cache = TitleCache(tmp_path / "titles.db")
+        generator = make_generator("Cached Title", cache=cache)
+
+        assert await generator.generate_title("Same message") == "Cached Title"
+        assert await generator.generate_title("Same message") == "Cached Title"
+        generator.model.ainvoke.assert_called_once()
@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 import pytest
-from rich.text import Text
 
 from deepagents_cli.config import COLORS
-from deepagents_cli.widgets.skill_card import SkillCard
+from deepagents_cli.widgets.skill_card import SkillCard, _render_card
+
+
+@pytest.fixture(autouse=True)
+def _clear_render_cache():
+    """Start each test with an empty shared render cache."""
+    _render_card.cache_clear()
+    yield
+    _render_card.cache_clear()
 
 
 class TestSkillCard:
@@ -36,6 +43,8 @@ class TestSkillCard:
 
     def test_render_returns_rich_text(self):
         """Test that render returns a Rich Text object."""
+        from rich.text import Text
+
         card = SkillCard(
             name="test-skill",
             description="Test description",
@@ -44,6 +53,24 @@ class TestSkillCard:
         result = card.render()
         assert isinstance(result, Text)
 
+    def test_render_reuses_cached_text(self):
+        """Test that repeated renders return the same prebuilt Text."""
+        card = SkillCard(
+            name="test-skill",
+            description="Test description",
+            source="user",
+        )
+        assert card.render() is card.render()
+
+    def test_identical_cards_share_rendered_text(self):
+        """Test that cards for the same skill reuse one cached Text."""
+        first = SkillCard(name="shared-skill", description="Shared", source="user")
+        second = SkillCard(name="shared-skill", description="Shared", source="user")
+        other = SkillCard(name="shared-skill", description="Shared", source="project")
+
+        assert first.render() is second.render()
+        assert other.render() is not first.render()
+
     def test_render_includes_skill_name(self):
         """Test that render output includes the skill name."""
         card = SkillCard(
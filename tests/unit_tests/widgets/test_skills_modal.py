@@ -8,12 +8,30 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from deepagents_cli.widgets.skills_modal import SkillsModal
-from deepagents_cli.widgets.skills_messages import SkillsCancelled, SkillsSelected
+
+# Resolved once so the API checks below do not each walk the MRO
+_SKILLS_MODAL_DIR = frozenset(dir(SkillsModal))
+_REQUIRED_API = (
+    "compose",
+    "on_mount",
+    "_fetch_skills",
+    "_show_skills",
+    "_update_selection",
+    "action_navigate_up",
+    "action_navigate_down",
+    "action_navigate_left",
+    "action_navigate_right",
+    "action_select",
+    "action_cancel",
+    "on_click",
+)
 
 
 class TestSkillsModal:
     """Test suite for SkillsModal screen."""
 
+    _BINDING_KEYS = frozenset(binding.key for binding in SkillsModal.BINDINGS)
+
     def test_skills_modal_inherits_from_modal_screen(self):
         """Test that SkillsModal inherits from ModalScreen."""
         assert "ModalScreen" in [base.__name__ for base in SkillsModal.__bases__]
@@ -47,54 +65,16 @@ class TestSkillsModal:
 
     def test_bindings_include_navigation(self):
         """Test that bindings include arrow key navigation."""
-        bindings = SkillsModal.BINDINGS
-        binding_keys = [binding.key for binding in bindings]
-        assert "up" in binding_keys
-        assert "down" in binding_keys
-        assert "left" in binding_keys
-        assert "right" in binding_keys
+        assert {"up", "down", "left", "right"} <= self._BINDING_KEYS
 
     def test_bindings_include_selection(self):
         """Test that bindings include selection keys."""
-        bindings = SkillsModal.BINDINGS
-        binding_keys = [binding.key for binding in bindings]
-        assert "enter" in binding_keys
-        assert "escape" in binding_keys
-
-    def test_skills_modal_has_compose_method(self):
-        """Test that SkillsModal has compose method."""
-        assert hasattr(SkillsModal, "compose")
-
-    def test_skills_modal_has_on_mount_method(self):
-        """Test that SkillsModal has on_mount method."""
-        assert hasattr(SkillsModal, "on_mount")
-
-    def test_skills_modal_has_load_skills_method(self):
-        """Test that SkillsModal has _load_skills method."""
-        assert hasattr(SkillsModal, "_load_skills")
-
-    def test_skills_modal_has_update_selection_method(self):
-        """Test that SkillsModal has _update_selection method."""
-        assert hasattr(SkillsModal, "_update_selection")
+        assert {"enter", "escape"} <= self._BINDING_KEYS
 
-    def test_skills_modal_has_navigate_methods(self):
-        """Test that SkillsModal has navigation action methods."""
-        assert hasattr(SkillsModal, "action_navigate_up")
-        assert hasattr(SkillsModal, "action_navigate_down")
-        assert hasattr(SkillsModal, "action_navigate_left")
-        assert hasattr(SkillsModal, "action_navigate_right")
-
-    def test_skills_modal_has_select_method(self):
-        """Test that SkillsModal has action_select method."""
-        assert hasattr(SkillsModal, "action_select")
-
-    def test_skills_modal_has_cancel_method(self):
-        """Test that SkillsModal has action_cancel method."""
-        assert hasattr(SkillsModal, "action_cancel")
-
-    def test_skills_modal_has_on_click_method(self):
-        """Test that SkillsModal has on_click method."""
-        assert hasattr(SkillsModal, "on_click")
+    @pytest.mark.parametrize("name", _REQUIRED_API)
+    def test_skills_modal_has_required_method(self, name):
+        """Test that SkillsModal defines each lifecycle, action, and event method."""
+        assert name in _SKILLS_MODAL_DIR
 
 
 class TestSkillsModalIntegration:
@@ -102,7 +82,7 @@ class TestSkillsModalIntegration:
 
     @patch("deepagents_cli.widgets.skills_modal.list_skills")
     def test_load_skills_displays_cards(self, mock_list_skills):
-        """Test that _load_skills creates skill cards."""
+        """Test that fetched skills are shown as skill cards."""
         # Mock return value
         mock_list_skills.return_value = [
             {"name": "skill-1", "description": "First skill", "source": "user"},
@@ -115,8 +95,8 @@ class TestSkillsModalIntegration:
         modal._list = MagicMock()
         modal._empty_message = MagicMock()
 
-        # Call _load_skills
-        modal._load_skills()
+        # Fetch and show skills the way the load worker does
+        modal._show_skills(modal._fetch_skills())
 
         # Verify list_skills was called
         mock_list_skills.assert_called_once()
@@ -131,11 +111,25 @@ class TestSkillsModalIntegration:
         modal._list = MagicMock()
         modal._empty_message = MagicMock()
 
-        modal._load_skills()
+        modal._show_skills(modal._fetch_skills())
 
         # Verify empty message was displayed
         modal._empty_message.update.assert_called()
 
+    def test_on_mount_loads_skills_in_worker(self):
+        """Test that mounting shows a loading state and defers scanning to a worker."""
+        modal = SkillsModal(agent="agent")
+        modal._empty_message = MagicMock()
+
+        with (
+            patch.object(modal, "focus"),
+            patch.object(modal, "_load_skills_worker") as mock_worker,
+        ):
+            modal.on_mount()
+
+        mock_worker.assert_called_once()
+        modal._empty_message.update.assert_called_once_with("Loading skills…")
+
     def test_action_select_with_no_selection(self):
         """Test that action_select handles no selection gracefully."""
         modal = SkillsModal(agent="agent")
@@ -145,15 +139,111 @@ class TestSkillsModalIntegration:
         # Should not raise error
         modal.action_select()
 
-    def test_action_cancel_posts_cancelled_message(self):
-        """Test that action_cancel posts SkillsCancelled message."""
+    @patch("deepagents_cli.widgets.skills_modal.list_skills")
+    def test_on_click_selects_clicked_card(self, mock_list_skills):
+        """Test that clicking a card selects it via the card index."""
+        mock_list_skills.return_value = [
+            {"name": "skill-1", "description": "First skill", "source": "user"},
+            {"name": "skill-2", "description": "Second skill", "source": "project"},
+        ]
+
         modal = SkillsModal(agent="agent")
-        
-        with patch.object(modal, "post_message") as mock_post:
+        modal._list = MagicMock()
+        modal._empty_message = MagicMock()
+
+        with (
+            patch.object(modal, "_update_selection"),
+            patch.object(modal, "action_select") as mock_select,
+        ):
+            modal._show_skills(modal._fetch_skills())
+            modal.on_click(MagicMock(widget=modal._skill_cards[1]))
+            modal.on_click(MagicMock(widget=MagicMock()))
+
+        assert modal._selected_index == 1
+        mock_select.assert_called_once()
+
+    @patch("deepagents_cli.widgets.skills_modal.list_skills")
+    def test_cards_mount_in_batches_on_demand(self, mock_list_skills):
+        """Test that only the first batch mounts up front and the rest mount when reached."""
+        mock_list_skills.return_value = [
+            {"name": f"skill-{i}", "description": "Skill", "source": "user"} for i in range(120)
+        ]
+
+        modal = SkillsModal(agent="agent")
+        modal._list = MagicMock()
+        modal._empty_message = MagicMock()
+
+        with patch.object(modal, "_update_selection"):
+            modal._show_skills(modal._fetch_skills())
+
+        assert modal._mounted_count == 50
+        assert modal._list.mount_all.call_args[0][0] == modal._skill_cards[:50]
+
+        modal._ensure_mounted(119)
+
+        assert modal._mounted_count == 120
+        assert modal._list.mount_all.call_args[0][0] == modal._skill_cards[50:]
+
+    def test_update_selection_restyles_only_changed_cards(self):
+        """Test that moving the selection touches only the old and new cards."""
+        modal = SkillsModal(agent="agent")
+        modal._skill_cards = [MagicMock() for _ in range(4)]
+        modal._selected_index = 0
+        modal._update_selection()
+
+        for card in modal._skill_cards:
+            card.reset_mock()
+
+        modal._selected_index = 2
+        modal._update_selection()
+
+        modal._skill_cards[0].remove_class.assert_called_once_with("selected")
+        modal._skill_cards[2].add_class.assert_called_once_with("selected")
+        modal._skill_cards[2].focus.assert_called_once()
+        for untouched in (modal._skill_cards[1], modal._skill_cards[3]):
+            assert not untouched.method_calls
+
+    def test_navigation_wraps_around(self):
+        """Test that navigation wraps at both ends of the list."""
+        modal = SkillsModal(agent="agent")
+        modal._skill_cards = [MagicMock() for _ in range(3)]
+        modal._selected_index = 0
+
+        modal.action_navigate_up()
+        assert modal._selected_index == 2
+
+        modal.action_navigate_right()
+        assert modal._selected_index == 0
+
+    def test_navigation_without_cards_is_noop(self):
+        """Test that navigation does nothing when no skills are loaded."""
+        modal = SkillsModal(agent="agent")
+        modal.action_navigate_down()
+        assert modal._selected_index == -1
+
+    def test_action_select_with_stale_index(self):
+        """Test that action_select ignores an index past the end of the cards."""
+        modal = SkillsModal(agent="agent")
+        modal._skill_cards = [MagicMock()]
+        modal._selected_index = 3
+
+        with patch.object(modal, "dismiss") as mock_dismiss:
+            modal.action_select()
+
+        mock_dismiss.assert_not_called()
+
+    def test_action_cancel_dismisses_with_none(self):
+        """Test that action_cancel reports cancellation only through dismiss."""
+        modal = SkillsModal(agent="agent")
+
+        with (
+            patch.object(modal, "post_message") as mock_post,
+            patch.object(modal, "dismiss") as mock_dismiss,
+        ):
             modal.action_cancel()
-            mock_post.assert_called_once()
-            args = mock_post.call_args[0]
-            assert isinstance(args[0], SkillsCancelled)
+
+        mock_dismiss.assert_called_once_with(None)
+        mock_post.assert_not_called()
 
     def test_get_agent_returns_agent_name(self):
         """Test that _agent attribute stores the agent name."""